@@ -1,16 +1,24 @@
 """Application configuration."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 # Base directory
 BASE_DIR = Path(__file__).parent
 
-# Upload directory
+# Upload directory (created on first use, see get_upload_dir)
 UPLOAD_DIR = BASE_DIR / "uploads"
-UPLOAD_DIR.mkdir(exist_ok=True)
 
 # App settings
+APP_VERSION = "0.1.0"
 DEBUG = os.getenv("DEBUG", "false").lower() == "true"
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
 ALLOWED_FILE_TYPES = {"application/json", "application/x-yaml", "text/yaml", "text/plain"}
+
+
+@lru_cache(maxsize=1)
+def get_upload_dir() -> Path:
+    """Return the upload directory, creating it on first call."""
+    UPLOAD_DIR.mkdir(exist_ok=True)
+    return UPLOAD_DIR
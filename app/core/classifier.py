@@ -4,242 +4,218 @@ Change classifier.
 Classifies detected changes into breaking, potentially breaking, and non-breaking categories.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from app.core.rules import classify_change, get_rule_message
 from app.models.change import Change
 
+# A detected difference before classification: (rule, path, method, field)
+RawChange = Tuple[str, str, Optional[str], Optional[str]]
 
-class Classifier:
-    """Classifies API changes based on rules."""
 
-    @staticmethod
-    def classify_endpoint_removal(path: str) -> Change:
-        """Classify endpoint removal as breaking."""
-        return Change(
-            type="breaking",
-            category="endpoint",
-            path=path,
-            message=get_rule_message("endpoint_removed"),
-        )
+def _outcome(rule_type: str, category: str) -> tuple:
+    """Resolve a rule to its (classification, category, message) triple."""
+    return classify_change(rule_type), category, get_rule_message(rule_type)
+
+
+# rule -> (classification, category, message), resolved at import
+_CHANGE_OUTCOMES = {
+    "endpoint_removed": _outcome("endpoint_removed", "endpoint"),
+    "endpoint_added": _outcome("endpoint_added", "endpoint"),
+    "method_removed": _outcome("method_removed", "method"),
+    "method_added": _outcome("method_added", "method"),
+    "parameter_removed": _outcome("parameter_removed", "parameter"),
+    "optional_parameter_added": _outcome("optional_parameter_added", "parameter"),
+    "required_parameter_added": _outcome("required_parameter_added", "parameter"),
+    "parameter_type_changed": _outcome("parameter_type_changed", "parameter"),
+    "field_removed": _outcome("field_removed", "schema"),
+    "optional_field_added": _outcome("optional_field_added", "schema"),
+    "required_field_added": _outcome("required_field_added", "schema"),
+    "field_type_changed": _outcome("field_type_changed", "schema"),
+    "success_response_removed": _outcome("success_response_removed", "response"),
+    "non_2xx_response_removed": _outcome("non_2xx_response_removed", "response"),
+    "response_added": ("non_breaking", "response", "New response status"),
+}
+
+# (change_type, is_required) -> rule
+_PARAMETER_RULES = {
+    ("removed", False): "parameter_removed",
+    ("removed", True): "parameter_removed",
+    ("added", False): "optional_parameter_added",
+    ("added", True): "required_parameter_added",
+    ("type_changed", False): "parameter_type_changed",
+    ("type_changed", True): "parameter_type_changed",
+}
+
+# (change_type, is_required) -> rule
+_SCHEMA_RULES = {
+    ("removed", False): "field_removed",
+    ("removed", True): "field_removed",
+    ("added", False): "optional_field_added",
+    ("added", True): "required_field_added",
+    ("type_changed", False): "field_type_changed",
+    ("type_changed", True): "field_type_changed",
+}
+
+# (change_type, is_2xx) -> rule
+_RESPONSE_RULES = {
+    ("removed", True): "success_response_removed",
+    ("removed", False): "non_2xx_response_removed",
+    ("added", True): "response_added",
+    ("added", False): "response_added",
+}
+
+
+def build_changes(raw_changes: Iterable[RawChange]) -> List[Change]:
+    """
+    Classify raw diff entries in one pass.
+
+    Args:
+        raw_changes: (rule, path, method, field) entries; method is expected
+            to be uppercase already
+
+    Returns:
+        Classified changes, in input order
+    """
+    outcomes = _CHANGE_OUTCOMES
+    # The single-item inner loop only unpacks the looked-up outcome
+    return [
+        Change(change_class, category, path, method, field, message)
+        for rule, path, method, field in raw_changes
+        for change_class, category, message in (outcomes[rule],)
+    ]
+
+
+def _classify(
+    rule: str, path: str, method: Optional[str] = None, field: Optional[str] = None
+) -> Change:
+    """Classify a single change by its rule."""
+    change_class, category, message = _CHANGE_OUTCOMES[rule]
+    return Change(change_class, category, path, method, field, message)
+
+
+def classify_endpoint_removal(path: str) -> Change:
+    """Classify endpoint removal as breaking."""
+    return _classify("endpoint_removed", path)
+
 
-    @staticmethod
-    def classify_endpoint_addition(path: str) -> Change:
-        """Classify endpoint addition as non-breaking."""
+def classify_endpoint_addition(path: str) -> Change:
+    """Classify endpoint addition as non-breaking."""
+    return _classify("endpoint_added", path)
+
+
+def classify_method_removal(path: str, method: str) -> Change:
+    """Classify method removal as breaking."""
+    return _classify("method_removed", path, method.upper())
+
+
+def classify_method_addition(path: str, method: str) -> Change:
+    """Classify method addition as non-breaking."""
+    return _classify("method_added", path, method.upper())
+
+
+def classify_parameter_change(
+    path: str,
+    method: str,
+    param_name: str,
+    change_type: str,
+    is_required: bool = False,
+) -> Change:
+    """
+    Classify parameter changes.
+
+    Args:
+        path: The API path
+        method: The HTTP method
+        param_name: The parameter name
+        change_type: Type of change (added, removed, type_changed)
+        is_required: Whether the parameter is required
+
+    Returns:
+        Classified change
+    """
+    rule = _PARAMETER_RULES.get((change_type, bool(is_required)))
+    if rule is None:
         return Change(
-            type="non_breaking",
-            category="endpoint",
+            type="potentially_breaking",
+            category="parameter",
             path=path,
-            message=get_rule_message("endpoint_added"),
+            method=method.upper(),
+            field=param_name,
+            message="Parameter changed",
         )
+    return _classify(rule, path, method.upper(), param_name)
+
 
-    @staticmethod
-    def classify_method_removal(path: str, method: str) -> Change:
-        """Classify method removal as breaking."""
+def classify_schema_change(
+    path: str,
+    method: str,
+    field_name: str,
+    change_type: str,
+    is_required: bool = False,
+) -> Change:
+    """
+    Classify schema/field changes.
+
+    Args:
+        path: The API path
+        method: The HTTP method
+        field_name: The field name
+        change_type: Type of change (added, removed, type_changed)
+        is_required: Whether the field is required
+
+    Returns:
+        Classified change
+    """
+    rule = _SCHEMA_RULES.get((change_type, bool(is_required)))
+    if rule is None:
         return Change(
-            type="breaking",
-            category="method",
+            type="potentially_breaking",
+            category="schema",
             path=path,
             method=method.upper(),
-            message=get_rule_message("method_removed"),
+            field=field_name,
+            message="Field changed",
         )
+    return _classify(rule, path, method.upper(), field_name)
+
+
+def classify_response_change(
+    path: str, method: str, status_code: str, change_type: str
+) -> Change:
+    """
+    Classify response changes.
+
+    Args:
+        path: The API path
+        method: The HTTP method
+        status_code: The HTTP status code
+        change_type: Type of change (added, removed)
 
-    @staticmethod
-    def classify_method_addition(path: str, method: str) -> Change:
-        """Classify method addition as non-breaking."""
+    Returns:
+        Classified change
+    """
+    field = f"Response {status_code}"
+    rule = _RESPONSE_RULES.get((change_type, status_code.startswith("2")))
+    if rule is None:
         return Change(
-            type="non_breaking",
-            category="method",
+            type="potentially_breaking",
+            category="response",
             path=path,
             method=method.upper(),
-            message=get_rule_message("method_added"),
+            field=field,
+            message="Response changed",
         )
+    return _classify(rule, path, method.upper(), field)
+
+
+class Classifier:
+    """Classifies API changes based on rules."""
 
-    @staticmethod
-    def classify_parameter_change(
-        path: str,
-        method: str,
-        param_name: str,
-        change_type: str,
-        is_required: bool = False,
-    ) -> Change:
-        """
-        Classify parameter changes.
-        
-        Args:
-            path: The API path
-            method: The HTTP method
-            param_name: The parameter name
-            change_type: Type of change (added, removed, type_changed)
-            is_required: Whether the parameter is required
-            
-        Returns:
-            Classified change
-        """
-        if change_type == "removed":
-            return Change(
-                type="breaking",
-                category="parameter",
-                path=path,
-                method=method.upper(),
-                field=param_name,
-                message=get_rule_message("parameter_removed"),
-            )
-        elif change_type == "added":
-            if is_required:
-                return Change(
-                    type="breaking",
-                    category="parameter",
-                    path=path,
-                    method=method.upper(),
-                    field=param_name,
-                    message=get_rule_message("required_parameter_added"),
-                )
-            else:
-                return Change(
-                    type="non_breaking",
-                    category="parameter",
-                    path=path,
-                    method=method.upper(),
-                    field=param_name,
-                    message=get_rule_message("optional_parameter_added"),
-                )
-        elif change_type == "type_changed":
-            return Change(
-                type="breaking",
-                category="parameter",
-                path=path,
-                method=method.upper(),
-                field=param_name,
-                message=get_rule_message("parameter_type_changed"),
-            )
-        else:
-            return Change(
-                type="potentially_breaking",
-                category="parameter",
-                path=path,
-                method=method.upper(),
-                field=param_name,
-                message="Parameter changed",
-            )
-
-    @staticmethod
-    def classify_schema_change(
-        path: str,
-        method: str,
-        field_name: str,
-        change_type: str,
-        is_required: bool = False,
-    ) -> Change:
-        """
-        Classify schema/field changes.
-        
-        Args:
-            path: The API path
-            method: The HTTP method
-            field_name: The field name
-            change_type: Type of change (added, removed, type_changed)
-            is_required: Whether the field is required
-            
-        Returns:
-            Classified change
-        """
-        if change_type == "removed":
-            return Change(
-                type="breaking",
-                category="schema",
-                path=path,
-                method=method.upper(),
-                field=field_name,
-                message=get_rule_message("field_removed"),
-            )
-        elif change_type == "added":
-            if is_required:
-                return Change(
-                    type="breaking",
-                    category="schema",
-                    path=path,
-                    method=method.upper(),
-                    field=field_name,
-                    message=get_rule_message("required_field_added"),
-                )
-            else:
-                return Change(
-                    type="non_breaking",
-                    category="schema",
-                    path=path,
-                    method=method.upper(),
-                    field=field_name,
-                    message=get_rule_message("optional_field_added"),
-                )
-        elif change_type == "type_changed":
-            return Change(
-                type="breaking",
-                category="schema",
-                path=path,
-                method=method.upper(),
-                field=field_name,
-                message=get_rule_message("field_type_changed"),
-            )
-        else:
-            return Change(
-                type="potentially_breaking",
-                category="schema",
-                path=path,
-                method=method.upper(),
-                field=field_name,
-                message="Field changed",
-            )
-
-    @staticmethod
-    def classify_response_change(
-        path: str, method: str, status_code: str, change_type: str
-    ) -> Change:
-        """
-        Classify response changes.
-        
-        Args:
-            path: The API path
-            method: The HTTP method
-            status_code: The HTTP status code
-            change_type: Type of change (added, removed)
-            
-        Returns:
-            Classified change
-        """
-        if change_type == "removed":
-            if status_code.startswith("2"):
-                return Change(
-                    type="breaking",
-                    category="response",
-                    path=path,
-                    method=method.upper(),
-                    field=f"Response {status_code}",
-                    message=get_rule_message("success_response_removed"),
-                )
-            else:
-                return Change(
-                    type="potentially_breaking",
-                    category="response",
-                    path=path,
-                    method=method.upper(),
-                    field=f"Response {status_code}",
-                    message=get_rule_message("non_2xx_response_removed"),
-                )
-        elif change_type == "added":
-            return Change(
-                type="non_breaking",
-                category="response",
-                path=path,
-                method=method.upper(),
-                field=f"Response {status_code}",
-                message="New response status",
-            )
-        else:
-            return Change(
-                type="potentially_breaking",
-                category="response",
-                path=path,
-                method=method.upper(),
-                field=f"Response {status_code}",
-                message="Response changed",
-            )
+    classify_endpoint_removal = staticmethod(classify_endpoint_removal)
+    classify_endpoint_addition = staticmethod(classify_endpoint_addition)
+    classify_method_removal = staticmethod(classify_method_removal)
+    classify_method_addition = staticmethod(classify_method_addition)
+    classify_parameter_change = staticmethod(classify_parameter_change)
+    classify_schema_change = staticmethod(classify_schema_change)
+    classify_response_change = staticmethod(classify_response_change)
+    build_changes = staticmethod(build_changes)
@@ -5,121 +5,194 @@ Detects breaking, potentially breaking, and non-breaking changes
 between two API specifications.
 """
 
-from typing import Dict, Any, List, Tuple
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Deque, List, Tuple
 from app.models.change import Change
-from app.core.classifier import Classifier
-from app.core.normalizer import Normalizer
+from app.core.classifier import RawChange, build_changes
+from app.core.normalizer import (
+    extract_parameters_v2,
+    extract_parameters_v3,
+    extract_paths,
+    extract_responses,
+)
+
+# Below this many paths, process pool startup outweighs the parallel gain
+PARALLEL_MIN_PATHS = 200
+
+# Parameter locations compared per operation, interned for identity lookups
+_PARAM_LOCATIONS = tuple(sys.intern(loc) for loc in ("query", "path", "header"))
 
 
 class Differ:
     """Compares two API specifications and detects changes."""
 
+    __slots__ = (
+        "changes",
+        "_raw_changes",
+        "_body_schema_cache",
+        "_extract_old_params",
+        "_extract_new_params",
+        "_has_request_body",
+        "_mixed_versions",
+    )
+
     def __init__(self):
         self.changes: List[Change] = []
-
-    def diff(self, old_spec: Dict[str, Any], new_spec: Dict[str, Any]) -> List[Change]:
+        # Unclassified (rule, path, method, field) entries, appended to from
+        # many inner loops; a deque never reallocates
+        self._raw_changes: Deque[RawChange] = deque()
+        # id(request_body) -> extracted schema; only valid for one diff() call
+        self._body_schema_cache: Dict[int, Dict[str, Any]] = {}
+        self._bind_spec_versions(True, True)
+
+    def diff(
+        self,
+        old_spec: Dict[str, Any],
+        new_spec: Dict[str, Any],
+        parallel: bool = False,
+    ) -> List[Change]:
         """
         Compare two specifications and return list of changes.
         
         Args:
             old_spec: The original specification
             new_spec: The new specification
+            parallel: Diff operations of large specs in a process pool
             
         Returns:
             List of detected changes
         """
-        self.changes = []
-        
-        # Normalize both specs
-        old_normalized = Normalizer.normalize(old_spec)
-        new_normalized = Normalizer.normalize(new_spec)
+        self._raw_changes = deque()
+        self._body_schema_cache = {}
+        old_is_openapi3 = "swagger" not in old_spec
+        new_is_openapi3 = "swagger" not in new_spec
+        self._bind_spec_versions(old_is_openapi3, new_is_openapi3)
 
-        # Extract paths
-        old_paths = old_normalized.get("paths", {})
-        new_paths = new_normalized.get("paths", {})
+        # Extract normalized paths; the rest of the spec is not diffed
+        old_paths = extract_paths(old_spec)
+        new_paths = extract_paths(new_spec)
 
         # Detect endpoint-level changes
         self._diff_endpoints(old_paths, new_paths)
 
         # Detect method and operation-level changes
-        self._diff_operations(old_paths, new_paths)
-
+        if parallel and len(old_paths) > PARALLEL_MIN_PATHS:
+            self._diff_operations_parallel(
+                old_paths, new_paths, old_is_openapi3, new_is_openapi3
+            )
+        else:
+            self._diff_operations(old_paths, new_paths)
+
+        # Classify everything in one batch
+        self.changes = build_changes(self._raw_changes)
         return self.changes
 
+    def _bind_spec_versions(self, old_is_openapi3: bool, new_is_openapi3: bool) -> None:
+        """Select the version-specific helpers once instead of per operation."""
+        self._extract_old_params = (
+            extract_parameters_v3 if old_is_openapi3
+            else extract_parameters_v2
+        )
+        self._extract_new_params = (
+            extract_parameters_v3 if new_is_openapi3
+            else extract_parameters_v2
+        )
+        # Swagger 2.0 has no requestBody; body params are diffed as parameters
+        self._has_request_body = old_is_openapi3 or new_is_openapi3
+        # Swagger 2.0 parameters carry "type", OpenAPI 3 ones a "schema"
+        self._mixed_versions = old_is_openapi3 != new_is_openapi3
+
     def _diff_endpoints(
         self, old_paths: Dict[str, Any], new_paths: Dict[str, Any]
     ) -> None:
         """Detect added and removed endpoints."""
+        append = self._raw_changes.append
+
         # Removed endpoints
         for path in old_paths:
             if path not in new_paths:
-                self.changes.append(Classifier.classify_endpoint_removal(path))
+                append(("endpoint_removed", path, None, None))
 
         # Added endpoints
         for path in new_paths:
             if path not in old_paths:
-                self.changes.append(Classifier.classify_endpoint_addition(path))
+                append(("endpoint_added", path, None, None))
 
     def _diff_operations(
         self, old_paths: Dict[str, Any], new_paths: Dict[str, Any]
     ) -> None:
         """Detect changes in HTTP methods and operations."""
+        append = self._raw_changes.append
+
         # Check common paths
         for path in old_paths:
             if path not in new_paths:
                 continue
 
-            old_path_item = old_paths[path]
-            new_path_item = new_paths[path]
+            # Normalized path items hold only lowercase method operations
+            old_methods = old_paths[path]
+            new_methods = new_paths[path]
 
-            # Get all methods
-            old_methods = {
-                k: v
-                for k, v in old_path_item.items()
-                if isinstance(v, dict) and k.lower() in (
-                    "get", "post", "put", "delete", "patch", "options", "head"
-                )
-            }
-            new_methods = {
-                k: v
-                for k, v in new_path_item.items()
-                if isinstance(v, dict) and k.lower() in (
-                    "get", "post", "put", "delete", "patch", "options", "head"
-                )
-            }
-
-            # Removed methods
+            # Removed methods; remember common ones in spec order
+            common_methods = []
             for method in old_methods:
-                if method not in new_methods:
-                    self.changes.append(
-                        Classifier.classify_method_removal(path, method)
-                    )
+                if method in new_methods:
+                    common_methods.append(method)
+                else:
+                    append(("method_removed", path, method.upper(), None))
 
             # Added methods
             for method in new_methods:
                 if method not in old_methods:
-                    self.changes.append(
-                        Classifier.classify_method_addition(path, method)
-                    )
+                    append(("method_added", path, method.upper(), None))
 
-            # Changed methods
-            for method in old_methods:
-                if method in new_methods:
-                    self._diff_operation(
-                        path, method, old_methods[method], new_methods[method]
-                    )
+            # Changed methods; changes report the method in uppercase
+            for method in common_methods:
+                self._diff_operation(
+                    path, method.upper(), old_methods[method], new_methods[method]
+                )
+
+    def _diff_operations_parallel(
+        self,
+        old_paths: Dict[str, Any],
+        new_paths: Dict[str, Any],
+        old_is_openapi3: bool,
+        new_is_openapi3: bool,
+    ) -> None:
+        """Detect operation changes by diffing chunks of common paths in parallel."""
+        common_paths = [path for path in old_paths if path in new_paths]
+        if not common_paths:
+            return
+
+        workers = os.cpu_count() or 1
+        chunk_size = -(-len(common_paths) // workers)
+        chunks = []
+        for start in range(0, len(common_paths), chunk_size):
+            chunk = common_paths[start:start + chunk_size]
+            chunks.append((
+                {path: old_paths[path] for path in chunk},
+                {path: new_paths[path] for path in chunk},
+                old_is_openapi3,
+                new_is_openapi3,
+            ))
+
+        # map() yields in submission order, so results keep spec order
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            for raw_changes in executor.map(_diff_operations_chunk, chunks):
+                self._raw_changes.extend(raw_changes)
 
     def _diff_operation(
         self, path: str, method: str, old_op: Dict[str, Any], new_op: Dict[str, Any]
     ) -> None:
         """Detect changes within a single operation."""
-        is_openapi3 = "parameters" in old_op or "requestBody" in old_op
-
         # Diff parameters
-        self._diff_parameters(path, method, old_op, new_op, is_openapi3)
+        self._diff_parameters(path, method, old_op, new_op)
 
         # Diff request body
-        if is_openapi3:
+        if self._has_request_body:
             self._diff_request_body(path, method, old_op, new_op)
 
         # Diff responses
@@ -131,52 +204,55 @@ class Differ:
         method: str,
         old_op: Dict[str, Any],
         new_op: Dict[str, Any],
-        is_openapi3: bool,
     ) -> None:
         """Detect parameter changes."""
-        old_params = Normalizer.extract_parameters(old_op, is_openapi3)
-        new_params = Normalizer.extract_parameters(new_op, is_openapi3)
+        old_params = self._extract_old_params(old_op)
+        new_params = self._extract_new_params(new_op)
+
+        append = self._raw_changes.append
 
         # Check each parameter type (query, path, header)
-        for param_in in ("query", "path", "header"):
+        for param_in in _PARAM_LOCATIONS:
             old_in_params = old_params.get(param_in, {})
             new_in_params = new_params.get(param_in, {})
 
-            # Removed parameters
+            # Removed parameters; remember common ones in spec order
+            common_params = []
             for param_name in old_in_params:
-                if param_name not in new_in_params:
-                    self.changes.append(
-                        Classifier.classify_parameter_change(
-                            path, method, param_name, "removed"
-                        )
-                    )
+                if param_name in new_in_params:
+                    common_params.append(param_name)
+                else:
+                    append(("parameter_removed", path, method, param_name))
 
             # Added parameters
             for param_name in new_in_params:
                 if param_name not in old_in_params:
-                    is_required = new_in_params[param_name].get("required", False)
-                    self.changes.append(
-                        Classifier.classify_parameter_change(
-                            path, method, param_name, "added", is_required
-                        )
-                    )
+                    if new_in_params[param_name].get("required", False):
+                        rule = "required_parameter_added"
+                    else:
+                        rule = "optional_parameter_added"
+                    append((rule, path, method, param_name))
 
             # Changed parameters (type changes)
-            for param_name in old_in_params:
-                if param_name in new_in_params:
-                    old_param = old_in_params[param_name]
-                    new_param = new_in_params[param_name]
-
-                    # Type comparison (simplified)
-                    old_type = str(old_param.get("schema") or old_param.get("type", ""))
-                    new_type = str(new_param.get("schema") or new_param.get("type", ""))
-
-                    if old_type != new_type and old_type and new_type:
-                        self.changes.append(
-                            Classifier.classify_parameter_change(
-                                path, method, param_name, "type_changed"
-                            )
-                        )
+            for param_name in common_params:
+                old_param = old_in_params[param_name]
+                new_param = new_in_params[param_name]
+
+                if self._mixed_versions:
+                    # Only the declared type is comparable across versions
+                    old_type = _declared_type(old_param)
+                    new_type = _declared_type(new_param)
+                else:
+                    # Type comparison (simplified); shared schemas are unchanged
+                    old_type = old_param.get("schema") or old_param.get("type", "")
+                    new_type = new_param.get("schema") or new_param.get("type", "")
+                    if old_type is new_type:
+                        continue
+
+                    old_type = str(old_type)
+                    new_type = str(new_type)
+                if old_type != new_type and old_type and new_type:
+                    append(("parameter_type_changed", path, method, param_name))
 
     def _diff_request_body(
         self, path: str, method: str, old_op: Dict[str, Any], new_op: Dict[str, Any]
@@ -212,74 +288,104 @@ class Differ:
         old_required = set(old_schema.get("required", []))
         new_required = set(new_schema.get("required", []))
 
-        # Removed properties
+        append = self._raw_changes.append
+
+        # Removed properties; remember common ones in spec order
+        common_props = []
         for prop_name in old_props:
-            if prop_name not in new_props:
-                self.changes.append(
-                    Classifier.classify_schema_change(
-                        path, method, prop_name, "removed"
-                    )
-                )
+            if prop_name in new_props:
+                common_props.append(prop_name)
+            else:
+                append(("field_removed", path, method, prop_name))
 
         # Added properties
         for prop_name in new_props:
             if prop_name not in old_props:
-                is_required = prop_name in new_required
-                self.changes.append(
-                    Classifier.classify_schema_change(
-                        path, method, prop_name, "added", is_required
-                    )
-                )
+                if prop_name in new_required:
+                    rule = "required_field_added"
+                else:
+                    rule = "optional_field_added"
+                append((rule, path, method, prop_name))
 
         # Changed property types
-        for prop_name in old_props:
-            if prop_name in new_props:
-                old_prop_type = str(old_props[prop_name].get("type", ""))
-                new_prop_type = str(new_props[prop_name].get("type", ""))
+        for prop_name in common_props:
+            old_prop = old_props[prop_name]
+            new_prop = new_props[prop_name]
+            if old_prop is new_prop:
+                continue
 
-                if old_prop_type != new_prop_type and old_prop_type and new_prop_type:
-                    self.changes.append(
-                        Classifier.classify_schema_change(
-                            path, method, prop_name, "type_changed"
-                        )
-                    )
+            old_prop_type = old_prop.get("type", "")
+            new_prop_type = new_prop.get("type", "")
+            if old_prop_type != new_prop_type and old_prop_type and new_prop_type:
+                append(("field_type_changed", path, method, prop_name))
 
     def _diff_responses(
         self, path: str, method: str, old_op: Dict[str, Any], new_op: Dict[str, Any]
     ) -> None:
         """Detect response changes."""
-        old_responses = Normalizer.extract_responses(old_op)
-        new_responses = Normalizer.extract_responses(new_op)
+        old_responses = extract_responses(old_op)
+        new_responses = extract_responses(new_op)
+        append = self._raw_changes.append
 
         # Removed responses
         for status_code in old_responses:
             if status_code not in new_responses:
-                self.changes.append(
-                    Classifier.classify_response_change(
-                        path, method, status_code, "removed"
-                    )
-                )
+                if status_code.startswith("2"):
+                    rule = "success_response_removed"
+                else:
+                    rule = "non_2xx_response_removed"
+                append((rule, path, method, f"Response {status_code}"))
 
         # Added responses
         for status_code in new_responses:
             if status_code not in old_responses:
-                self.changes.append(
-                    Classifier.classify_response_change(
-                        path, method, status_code, "added"
-                    )
-                )
+                append(("response_added", path, method, f"Response {status_code}"))
 
-    @staticmethod
     def _extract_schema_from_request_body(
-        request_body: Dict[str, Any],
+        self, request_body: Dict[str, Any],
     ) -> Dict[str, Any]:
-        """Extract schema from request body object."""
+        """
+        Extract schema from request body object.
+
+        Results are memoized by object identity, since a request body
+        resolved from a shared reference is the same dict for every
+        operation that uses it. The specs outlive the diff() call, so ids
+        cannot be reused while the cache is alive.
+        """
         if not request_body:
             return {}
 
+        key = id(request_body)
+        cached = self._body_schema_cache.get(key)
+        if cached is not None:
+            return cached
+
         content = request_body.get("content", {})
         for content_type, content_spec in content.items():
             schema = content_spec.get("schema", {})
             if schema:
-                return schema
-        return {}
+                break
+        else:
+            schema = {}
+
+        self._body_schema_cache[key] = schema
+        return schema
+
+
+def _declared_type(param: Dict[str, Any]) -> str:
+    """Get a parameter's type from either a Swagger 2.0 or OpenAPI 3 entry."""
+    schema = param.get("schema")
+    if schema:
+        return schema.get("type") or ""
+    return param.get("type") or ""
+
+
+def _diff_operations_chunk(
+    chunk: Tuple[Dict[str, Any], Dict[str, Any], bool, bool],
+) -> List[RawChange]:
+    """Diff operations for one chunk of common paths in a worker process."""
+    old_paths, new_paths, old_is_openapi3, new_is_openapi3 = chunk
+    differ = Differ()
+    differ._bind_spec_versions(old_is_openapi3, new_is_openapi3)
+    differ._diff_operations(old_paths, new_paths)
+    return list(differ._raw_changes)
@@ -6,8 +6,35 @@ in both JSON and YAML formats.
 """
 
 import json
+import sys
 import yaml
-from typing import Any, Dict
+from typing import Any, Dict, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml bindings not available
+    from yaml import SafeLoader
+
+# Longer strings (descriptions, examples) rarely repeat; leave them alone
+_INTERN_MAX_LEN = 64
+
+
+def _construct_interned_str(loader: SafeLoader, node: yaml.ScalarNode) -> str:
+    """Construct a YAML string, interning it if short."""
+    value = loader.construct_scalar(node)
+    return sys.intern(value) if len(value) <= _INTERN_MAX_LEN else value
+
+
+class _InterningLoader(SafeLoader):
+    """SafeLoader that shares one object per repeated short string."""
+
+
+_InterningLoader.add_constructor("tag:yaml.org,2002:str", _construct_interned_str)
 
 
 class ParseError(Exception):
@@ -19,12 +46,12 @@ class Parser:
     """Parser for OpenAPI and Swagger specifications."""
 
     @staticmethod
-    def parse(content: str, file_type: str = "json") -> Dict[str, Any]:
+    def parse(content: Union[str, bytes], file_type: str = "json") -> Dict[str, Any]:
         """
         Parse API specification from string content.
         
         Args:
-            content: The spec content (JSON or YAML string)
+            content: The spec content (JSON or YAML, as text or UTF-8 bytes)
             file_type: Type of file ("json" or "yaml")
             
         Returns:
@@ -33,17 +60,17 @@ class Parser:
         Raises:
             ParseError: If parsing or validation fails
         """
-        if not content or not content.strip():
+        if not content or content.isspace():
             raise ParseError("Specification is empty")
 
+        loader = _LOADERS.get(file_type.lower())
+        if loader is None:
+            raise ParseError(f"Unsupported file type: {file_type}")
+
         try:
-            if file_type.lower() == "json":
-                spec = json.loads(content)
-            elif file_type.lower() in ("yaml", "yml"):
-                spec = yaml.safe_load(content)
-            else:
-                raise ParseError(f"Unsupported file type: {file_type}")
+            spec = loader(content)
         except json.JSONDecodeError as e:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
             raise ParseError(f"Invalid JSON: {str(e)}")
         except yaml.YAMLError as e:
             raise ParseError(f"Invalid YAML: {str(e)}")
@@ -53,11 +80,23 @@ class Parser:
         if not isinstance(spec, dict):
             raise ParseError("Specification must be a JSON object")
 
-        Parser._validate_spec(spec)
+        Parser.validate_spec(spec)
         return spec
 
     @staticmethod
-    def _validate_spec(spec: Dict[str, Any]) -> None:
+    def _load_json(content: Union[str, bytes]) -> Any:
+        """Decode JSON with the fastest available backend."""
+        if orjson is not None:
+            return orjson.loads(content)
+        return json.loads(content)
+
+    @staticmethod
+    def _load_yaml(content: Union[str, bytes]) -> Any:
+        """Decode YAML, using the libyaml bindings when available."""
+        return yaml.load(content, Loader=_InterningLoader)
+
+    @staticmethod
+    def validate_spec(spec: Dict[str, Any]) -> None:
         """
         Validate basic OpenAPI/Swagger structure.
         
@@ -84,7 +123,7 @@ class Parser:
             raise ParseError("Specification must include 'paths' field")
 
     @staticmethod
-    def detect_format(content: str) -> str:
+    def detect_format(content: Union[str, bytes]) -> str:
         """
         Detect whether content is JSON or YAML.
         
@@ -94,7 +133,17 @@ class Parser:
         Returns:
             "json" or "yaml"
         """
-        content = content.strip()
-        if content.startswith("{"):
+        # Only the first non-whitespace character matters; never copy the
+        # whole document just to look at it.
+        first = content[:256].lstrip()[:1]
+        if first in ("{", "[", b"{", b"["):
             return "json"
         return "yaml"
+
+
+# file type -> loader, resolved once instead of branching on every parse
+_LOADERS = {
+    "json": Parser._load_json,
+    "yaml": Parser._load_yaml,
+    "yml": Parser._load_yaml,
+}
@@ -36,6 +36,18 @@ NON_BREAKING_RULES = {
     "metadata_changed": "Metadata-only changes",
 }
 
+# Flattened lookups, built once; applied in reverse so BREAKING_RULES wins
+_ALL_RULES = {}
+_RULE_CLASS = {}
+for _rules, _class in (
+    (NON_BREAKING_RULES, "non_breaking"),
+    (POTENTIALLY_BREAKING_RULES, "potentially_breaking"),
+    (BREAKING_RULES, "breaking"),
+):
+    _ALL_RULES.update(_rules)
+    _RULE_CLASS.update(dict.fromkeys(_rules, _class))
+del _rules, _class
+
 
 def classify_change(rule_type: str) -> str:
     """
@@ -47,15 +59,8 @@ def classify_change(rule_type: str) -> str:
     Returns:
         Classification: "breaking", "potentially_breaking", or "non_breaking"
     """
-    if rule_type in BREAKING_RULES:
-        return "breaking"
-    elif rule_type in POTENTIALLY_BREAKING_RULES:
-        return "potentially_breaking"
-    elif rule_type in NON_BREAKING_RULES:
-        return "non_breaking"
-    else:
-        # Default to potentially_breaking if uncertain
-        return "potentially_breaking"
+    # Default to potentially_breaking if uncertain
+    return _RULE_CLASS.get(rule_type, "potentially_breaking")
 
 
 def get_rule_message(rule_type: str) -> str:
@@ -68,9 +73,4 @@ def get_rule_message(rule_type: str) -> str:
     Returns:
         Human-readable message
     """
-    return (
-        BREAKING_RULES.get(rule_type) or
-        POTENTIALLY_BREAKING_RULES.get(rule_type) or
-        NON_BREAKING_RULES.get(rule_type) or
-        "Unknown change"
-    )
+    return _ALL_RULES.get(rule_type, "Unknown change")
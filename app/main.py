@@ -1,18 +1,25 @@
 """Main FastAPI application."""
 
 from fastapi import FastAPI, Request
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
+from app.config import APP_VERSION
 from app.routes import health, compare
 
 # Create FastAPI app
 app = FastAPI(
     title="SpecDrift",
     description="API Contract Drift Detector",
-    version="0.1.0",
+    version=APP_VERSION,
+    default_response_class=ORJSONResponse,
 )
 
+# Diff results are repetitive JSON and compress well; small bodies are sent
+# as-is since compressing them costs more than it saves
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Include routers
 app.include_router(health.router)
 app.include_router(compare.router)
@@ -24,9 +31,15 @@ if static_dir.exists():
 
 # Template rendering
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+from app.config import DEBUG
 
 template_dir = Path(__file__).parent / "templates"
 templates = Jinja2Templates(directory=str(template_dir))
+# Compile each template once per process and share the bytecode between
+# workers; only check templates for edits in debug mode
+templates.env.auto_reload = DEBUG
+templates.env.bytecode_cache = FileSystemBytecodeCache()
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -50,16 +63,20 @@ async def privacy_policy(request: Request):
     """Render the privacy policy page."""
     return templates.TemplateResponse("privacypolicy.html", {"request": request})
 
-@app.get("/favicon.ico", include_in_schema=False)
-async def favicon():
-    """Serve favicon."""
-    favicon_path = static_dir / "favicon.ico"
-    if favicon_path.exists():
-        return FileResponse(favicon_path)
-    return {"status": "not found"}
-
 
 if __name__ == "__main__":
+    import multiprocessing
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Multiple workers require an import string rather than the app object.
+    # "auto" picks uvloop and httptools when they are installed.
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=multiprocessing.cpu_count(),
+        loop="auto",
+        http="auto",
+        backlog=2048,
+        timeout_keep_alive=30,
+    )
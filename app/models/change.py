@@ -1,10 +1,10 @@
 """Data models for API changes."""
 
 from typing import Literal, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Change:
     """
     Represents a single change detected between two API specifications.
@@ -26,10 +26,19 @@ class Change:
 
     def to_dict(self) -> dict:
         """Convert change to dictionary."""
-        return asdict(self)
+        # Spelled out rather than dataclasses.asdict, which deep-copies
+        # every field through reflection
+        return {
+            "type": self.type,
+            "category": self.category,
+            "path": self.path,
+            "method": self.method,
+            "field": self.field,
+            "message": self.message,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class DiffResult:
     """
     Complete diff result containing summary and all detected changes.
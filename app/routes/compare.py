@@ -4,22 +4,84 @@ API comparison routes.
 Handles uploading specs and returning diff results.
 """
 
+import hashlib
+from typing import Optional, Tuple
+import orjson
 from fastapi import APIRouter, Request, Form, UploadFile, File, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
+from starlette.concurrency import run_in_threadpool
+from app.config import APP_VERSION
+from app.models.change import DiffResult
 from app.services.diff_service import DiffService
 
 router = APIRouter()
 
 
+def _spec_pair_etag(old_digest: str, new_digest: str) -> str:
+    """
+    Build a strong ETag for a pair of specs.
+
+    The app version is mixed in so that a deploy changing diff output does
+    not keep answering 304 for results computed by the previous release.
+
+    Args:
+        old_digest: content_digest() of the original spec
+        new_digest: content_digest() of the new spec
+
+    Returns:
+        Quoted ETag value
+    """
+    key = f"{APP_VERSION}:{old_digest}:{new_digest}".encode()
+    return f'"{hashlib.blake2b(key, digest_size=16).hexdigest()}"'
+
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+def _diff_unless_not_modified(
+    old_spec: str, new_spec: str, if_none_match: Optional[str]
+) -> Tuple[str, Optional[DiffResult]]:
+    """
+    Hash both specs once, then diff them unless the client's copy is current.
+
+    Runs in the threadpool; the digests double as parse cache keys.
+
+    Returns:
+        The ETag, and the diff result or None if If-None-Match matched
+    """
+    old_digest = DiffService.content_digest(old_spec)
+    new_digest = DiffService.content_digest(new_spec)
+    etag = _spec_pair_etag(old_digest, new_digest)
+    if if_none_match and _etag_matches(etag, if_none_match):
+        return etag, None
+
+    result = DiffService.diff_specs(
+        old_spec, new_spec, old_digest=old_digest, new_digest=new_digest
+    )
+    return etag, result
+
+
 @router.post("/api/compare")
 async def compare_specs(
+    request: Request,
     old_spec: str = Form(..., description="Old API specification content"),
     new_spec: str = Form(..., description="New API specification content"),
 ):
     """
     Compare two API specifications.
+
+    Responses carry an ETag derived from both specs. Clients re-sending the
+    same pair with a matching If-None-Match get 304 Not Modified without
+    the specs being parsed or diffed.
     
     Args:
+        request: The incoming request, for conditional headers
         old_spec: The original API specification (JSON or YAML)
         new_spec: The new API specification (JSON or YAML)
         
@@ -32,8 +94,58 @@ async def compare_specs(
         )
 
     try:
-        result = DiffService.compare_specs(old_spec, new_spec)
-        return JSONResponse(content=result)
+        etag, result = await run_in_threadpool(
+            _diff_unless_not_modified,
+            old_spec,
+            new_spec,
+            request.headers.get("if-none-match"),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    if result is None:
+        return Response(status_code=304, headers={"ETag": etag})
+    return ORJSONResponse(content=result, headers={"ETag": etag})
+
+
+@router.post("/api/compare-json")
+async def compare_json(request: Request):
+    """
+    Compare two API specifications sent as a JSON body.
+
+    Reads the raw body directly instead of going through multipart form
+    decoding, which saves a copy of each spec for large payloads.
+
+    Args:
+        request: Request whose body is {"old_spec": "...", "new_spec": "..."}
+
+    Returns:
+        JSON with comparison results
+    """
+    try:
+        payload = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Request body must be valid JSON")
+
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Request body must be a JSON object")
+
+    old_spec = payload.get("old_spec")
+    new_spec = payload.get("new_spec")
+    if not old_spec or not new_spec:
+        raise HTTPException(
+            status_code=400, detail="Both old_spec and new_spec are required"
+        )
+    if not isinstance(old_spec, str) or not isinstance(new_spec, str):
+        raise HTTPException(
+            status_code=400, detail="old_spec and new_spec must be strings"
+        )
+
+    try:
+        result = await run_in_threadpool(DiffService.diff_specs, old_spec, new_spec)
+        return ORJSONResponse(content=result)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -56,11 +168,14 @@ async def compare_files(
         JSON with comparison results
     """
     try:
-        old_content = (await old_file.read()).decode("utf-8")
-        new_content = (await new_file.read()).decode("utf-8")
+        # Raw bytes go straight to the parser; no intermediate str copy
+        old_content = await old_file.read()
+        new_content = await new_file.read()
 
-        result = DiffService.compare_specs(old_content, new_content)
-        return JSONResponse(content=result)
+        result = await run_in_threadpool(
+            DiffService.diff_specs, old_content, new_content
+        )
+        return ORJSONResponse(content=result)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
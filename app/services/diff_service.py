@@ -4,25 +4,44 @@ Diff service that orchestrates the diff process.
 Coordinates parsing, normalization, and diffing of specifications.
 """
 
-from typing import Dict, Any
-from app.core.parser import Parser, ParseError
-from app.core.differ import Differ
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, Union
 from app.models.change import Change, DiffResult
 
+# The parser (PyYAML, orjson) and differ are imported inside the
+# methods that use them, so workers only load them on their first comparison.
+
+# Parsed specs keyed by (content digest, format), least recently used first,
+# stored with their content size. Entries are shared between requests and
+# must be treated as read-only.
+SPEC_CACHE_SIZE = 32
+# Budget for the summed content size of cached specs, per worker. A parsed
+# spec retains roughly ten times its source size, and larger specs are
+# not cached at all.
+SPEC_CACHE_MAX_BYTES = 8 * 1024 * 1024
+_spec_cache: "OrderedDict[Tuple[str, str], Tuple[Dict[str, Any], int]]" = OrderedDict()
+_spec_cache_bytes = 0
+_spec_cache_lock = threading.Lock()
+
 
 class DiffService:
     """Service for orchestrating API spec diffs."""
 
     @staticmethod
     def compare_specs(
-        old_content: str, new_content: str, old_format: str = "auto", new_format: str = "auto"
+        old_content: Union[str, bytes],
+        new_content: Union[str, bytes],
+        old_format: str = "auto",
+        new_format: str = "auto",
     ) -> Dict[str, Any]:
         """
         Compare two API specifications and return diff result.
         
         Args:
-            old_content: Content of the original spec
-            new_content: Content of the new spec
+            old_content: Content of the original spec (text or UTF-8 bytes)
+            new_content: Content of the new spec (text or UTF-8 bytes)
             old_format: Format of old spec ("json", "yaml", or "auto")
             new_format: Format of new spec ("json", "yaml", or "auto")
             
@@ -32,6 +51,42 @@ class DiffService:
         Raises:
             ValueError: If specs cannot be parsed
         """
+        return DiffService.diff_specs(
+            old_content, new_content, old_format, new_format
+        ).to_dict()
+
+    @staticmethod
+    def diff_specs(
+        old_content: Union[str, bytes],
+        new_content: Union[str, bytes],
+        old_format: str = "auto",
+        new_format: str = "auto",
+        old_digest: Optional[str] = None,
+        new_digest: Optional[str] = None,
+    ) -> DiffResult:
+        """
+        Compare two API specifications, keeping changes as Change objects.
+
+        orjson serializes the result directly, so responses built from it
+        skip the intermediate per-change dicts of compare_specs.
+
+        Args:
+            old_content: Content of the original spec (text or UTF-8 bytes)
+            new_content: Content of the new spec (text or UTF-8 bytes)
+            old_format: Format of old spec ("json", "yaml", or "auto")
+            new_format: Format of new spec ("json", "yaml", or "auto")
+            old_digest: content_digest() of the old spec, if already known
+            new_digest: content_digest() of the new spec, if already known
+
+        Returns:
+            Diff result with summary and list of changes
+
+        Raises:
+            ValueError: If specs cannot be parsed
+        """
+        from app.core.parser import Parser, ParseError
+        from app.core.differ import Differ
+
         try:
             # Auto-detect format if not specified
             if not old_format or old_format == "auto":
@@ -39,9 +94,9 @@ class DiffService:
             if not new_format or new_format == "auto":
                 new_format = Parser.detect_format(new_content)
 
-            # Parse specifications
-            old_spec = Parser.parse(old_content, old_format)
-            new_spec = Parser.parse(new_content, new_format)
+            # Parse specifications, reusing recently seen ones
+            old_spec = DiffService._parse_cached(old_content, old_format, old_digest)
+            new_spec = DiffService._parse_cached(new_content, new_format, new_digest)
 
             # Perform diff
             differ = Differ()
@@ -57,7 +112,112 @@ class DiffService:
             raise ValueError(f"Unexpected error during comparison: {str(e)}")
 
     @staticmethod
-    def _build_result(changes: list[Change]) -> Dict[str, Any]:
+    def compare_dicts(
+        old_spec: Dict[str, Any], new_spec: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Compare two already-parsed API specifications.
+
+        For in-process callers holding specs as dicts; avoids serializing
+        them to text only to have them parsed again.
+
+        Args:
+            old_spec: The original specification
+            new_spec: The new specification
+
+        Returns:
+            Dictionary with summary and list of changes
+
+        Raises:
+            ValueError: If either spec is not a valid specification
+        """
+        from app.core.parser import Parser, ParseError
+        from app.core.differ import Differ
+
+        try:
+            for spec in (old_spec, new_spec):
+                if not isinstance(spec, dict):
+                    raise ParseError("Specification must be a JSON object")
+                Parser.validate_spec(spec)
+
+            changes = Differ().diff(old_spec, new_spec)
+            return DiffService._build_result(changes).to_dict()
+
+        except ParseError as e:
+            raise ValueError(f"Specification validation error: {str(e)}")
+        except Exception as e:
+            raise ValueError(f"Unexpected error during comparison: {str(e)}")
+
+    @staticmethod
+    def content_digest(content: Union[str, bytes]) -> str:
+        """
+        Compute the digest identifying spec content in the parse cache.
+
+        Args:
+            content: The spec content (text or UTF-8 bytes)
+
+        Returns:
+            Hex digest of the content
+        """
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    @staticmethod
+    def _parse_cached(
+        content: Union[str, bytes], file_type: str, digest: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Parse a specification, reusing the result for identical content.
+
+        The cache is bounded by both entry count and total content size.
+
+        Args:
+            content: The spec content
+            file_type: Type of file ("json" or "yaml")
+            digest: content_digest() of the content, if already known
+
+        Returns:
+            Parsed specification, possibly shared with earlier callers
+
+        Raises:
+            ParseError: If parsing or validation fails
+        """
+        if digest is None:
+            digest = DiffService.content_digest(content)
+        key = (digest, file_type)
+
+        global _spec_cache_bytes
+
+        with _spec_cache_lock:
+            entry = _spec_cache.get(key)
+            if entry is not None:
+                _spec_cache.move_to_end(key)
+                return entry[0]
+
+        from app.core.parser import Parser
+
+        spec = Parser.parse(content, file_type)
+        # Character count for text; close enough to the UTF-8 size to budget
+        size = len(content)
+        if size > SPEC_CACHE_MAX_BYTES:
+            return spec
+
+        with _spec_cache_lock:
+            previous = _spec_cache.pop(key, None)
+            if previous is not None:
+                _spec_cache_bytes -= previous[1]
+            _spec_cache[key] = (spec, size)
+            _spec_cache_bytes += size
+            while (
+                len(_spec_cache) > SPEC_CACHE_SIZE
+                or _spec_cache_bytes > SPEC_CACHE_MAX_BYTES
+            ):
+                _, (_, evicted_size) = _spec_cache.popitem(last=False)
+                _spec_cache_bytes -= evicted_size
+        return spec
+
+    @staticmethod
+    def _build_result(changes: list[Change]) -> DiffResult:
         """
         Build the final diff result with summary and changes.
         
@@ -65,23 +225,14 @@ class DiffService:
             changes: List of detected changes
             
         Returns:
-            Dictionary with summary and changes
+            Diff result with summary and changes
         """
         summary = {
             "breaking": 0,
             "potentially_breaking": 0,
             "non_breaking": 0,
         }
-
         for change in changes:
-            if change.type == "breaking":
-                summary["breaking"] += 1
-            elif change.type == "potentially_breaking":
-                summary["potentially_breaking"] += 1
-            elif change.type == "non_breaking":
-                summary["non_breaking"] += 1
-
-        return {
-            "summary": summary,
-            "changes": [change.to_dict() for change in changes],
-        }
+            summary[change.type] += 1
+
+        return DiffResult(summary=summary, changes=changes)
@@ -1,6 +1,13 @@
 """Unit tests for API diff logic."""
 
+import json
+from collections import OrderedDict
 import pytest
+from fastapi.testclient import TestClient
+from app.core.differ import Differ, PARALLEL_MIN_PATHS
+from app.main import app
+from app.routes import compare as compare_routes
+from app.services import diff_service
 from app.services.diff_service import DiffService
 
 
@@ -32,10 +39,7 @@ class TestDiffService:
             },
         }
 
-        result = DiffService.compare_specs(
-            str(old_spec).replace("'", '"'),
-            str(new_spec).replace("'", '"')
-        )
+        result = DiffService.compare_specs(json.dumps(old_spec), json.dumps(new_spec))
 
         # Find endpoint removed change
         endpoint_changes = [
@@ -98,10 +102,7 @@ class TestDiffService:
             },
         }
 
-        result = DiffService.compare_specs(
-            str(old_spec).replace("'", '"'),
-            str(new_spec).replace("'", '"')
-        )
+        result = DiffService.compare_dicts(old_spec, new_spec)
 
         # Find breaking schema change
         schema_changes = [
@@ -150,10 +151,7 @@ class TestDiffService:
             },
         }
 
-        result = DiffService.compare_specs(
-            str(old_spec).replace("'", '"'),
-            str(new_spec).replace("'", '"')
-        )
+        result = DiffService.compare_dicts(old_spec, new_spec)
 
         # Find type change
         type_changes = [
@@ -162,6 +160,89 @@ class TestDiffService:
         ]
         assert len(type_changes) > 0
 
+    def test_detect_swagger_2_parameter_type_changes(self):
+        """Test detection of parameter type changes in Swagger 2.0 specs."""
+        old_spec = {
+            "swagger": "2.0",
+            "info": {"title": "API", "version": "1.0.0"},
+            "paths": {
+                "/users": {
+                    "get": {
+                        "parameters": [
+                            {"name": "id", "in": "query", "type": "string"}
+                        ],
+                        "responses": {"200": {"description": "OK"}},
+                    }
+                }
+            },
+        }
+
+        new_spec = {
+            "swagger": "2.0",
+            "info": {"title": "API", "version": "1.0.0"},
+            "paths": {
+                "/users": {
+                    "get": {
+                        "parameters": [
+                            {"name": "id", "in": "query", "type": "integer"}
+                        ],
+                        "responses": {"200": {"description": "OK"}},
+                    }
+                }
+            },
+        }
+
+        result = DiffService.compare_dicts(old_spec, new_spec)
+
+        type_changes = [
+            c for c in result["changes"]
+            if c["category"] == "parameter" and c["type"] == "breaking"
+        ]
+        assert len(type_changes) == 1
+        assert type_changes[0]["field"] == "id"
+
+    def test_swagger_2_to_openapi_3_parameter_types(self):
+        """Test that migrating a spec from Swagger 2.0 to OpenAPI 3 compares declared types."""
+        def build_spec(name_type):
+            return {
+                "openapi": "3.0.0",
+                "info": {"title": "API", "version": "1.0.0"},
+                "paths": {
+                    "/users": {
+                        "get": {
+                            "parameters": [
+                                {"name": "id", "in": "query", "schema": {"type": "string"}},
+                                {"name": "name", "in": "query", "schema": {"type": name_type}},
+                            ],
+                            "responses": {"200": {"description": "OK"}},
+                        }
+                    }
+                },
+            }
+
+        old_spec = {
+            "swagger": "2.0",
+            "info": {"title": "API", "version": "1.0.0"},
+            "paths": {
+                "/users": {
+                    "get": {
+                        "parameters": [
+                            {"name": "id", "in": "query", "type": "string"},
+                            {"name": "name", "in": "query", "type": "string"},
+                        ],
+                        "responses": {"200": {"description": "OK"}},
+                    }
+                }
+            },
+        }
+
+        unchanged = DiffService.compare_dicts(old_spec, build_spec("string"))
+        assert unchanged["changes"] == []
+
+        changed = DiffService.compare_dicts(old_spec, build_spec("integer"))
+        assert [c["field"] for c in changed["changes"]] == ["name"]
+        assert changed["summary"]["breaking"] == 1
+
     def test_validate_summary_counts(self):
         """Test that summary counts are accurate."""
         old_spec = {
@@ -185,10 +266,7 @@ class TestDiffService:
             },
         }
 
-        result = DiffService.compare_specs(
-            str(old_spec).replace("'", '"'),
-            str(new_spec).replace("'", '"')
-        )
+        result = DiffService.compare_dicts(old_spec, new_spec)
 
         summary = result["summary"]
         assert summary["breaking"] + summary["potentially_breaking"] + summary["non_breaking"] == len(
@@ -196,11 +274,47 @@ class TestDiffService:
         )
         assert summary["non_breaking"] > 0  # POST method added
 
+    def test_identical_content_is_parsed_once(self, monkeypatch):
+        """Test that re-submitted spec content reuses the cached parse."""
+        monkeypatch.setattr(diff_service, "_spec_cache", OrderedDict())
+        monkeypatch.setattr(diff_service, "_spec_cache_bytes", 0)
+        content = '{"openapi": "3.0.0", "info": {"title": "Cached"}, "paths": {"/a": {}}}'
+
+        first = DiffService._parse_cached(content, "json")
+        second = DiffService._parse_cached(content, "json")
+
+        assert second is first
+
+    def test_spec_cache_is_bounded_by_content_size(self, monkeypatch):
+        """Test that the spec cache evicts by total content size and skips oversized specs."""
+        monkeypatch.setattr(diff_service, "_spec_cache", OrderedDict())
+        monkeypatch.setattr(diff_service, "_spec_cache_bytes", 0)
+
+        def build_content(title):
+            return json.dumps({"openapi": "3.0.0", "info": {"title": title}, "paths": {"/a": {}}})
+
+        first, second = build_content("First"), build_content("Second")
+        monkeypatch.setattr(diff_service, "SPEC_CACHE_MAX_BYTES", len(first) + len(second) - 1)
+
+        DiffService._parse_cached(first, "json")
+        DiffService._parse_cached(second, "json")
+        assert len(diff_service._spec_cache) == 1
+        assert diff_service._spec_cache_bytes == len(second)
+
+        DiffService._parse_cached(build_content("Oversized" * 20), "json")
+        assert len(diff_service._spec_cache) == 1
+
     def test_invalid_spec_raises_error(self):
         """Test that invalid specs raise appropriate errors."""
         with pytest.raises(ValueError):
             DiffService.compare_specs("invalid json", "{}")
 
+    @pytest.mark.parametrize("content", ["5", "null", "true", '"spec"', "[1, 2]"])
+    def test_non_object_json_raises_error(self, content):
+        """Test that a JSON document that is not an object is rejected as such."""
+        with pytest.raises(ValueError, match="must be a JSON object"):
+            DiffService.compare_specs(content, content, "json", "json")
+
     def test_missing_required_fields_raises_error(self):
         """Test that specs missing required fields raise errors."""
         incomplete_spec = {
@@ -211,9 +325,137 @@ class TestDiffService:
 
         with pytest.raises(ValueError):
             DiffService.compare_specs(
-                str(incomplete_spec).replace("'", '"'),
-                str(incomplete_spec).replace("'", '"')
+                json.dumps(incomplete_spec), json.dumps(incomplete_spec)
             )
+        with pytest.raises(ValueError):
+            DiffService.compare_dicts(incomplete_spec, incomplete_spec)
+
+
+class TestDiffer:
+    """Tests for the differ."""
+
+    def test_parallel_diff_matches_serial(self):
+        """Test that parallel diffing reports the same changes in the same order."""
+        def build_spec(param_type, extra_status):
+            return {
+                "openapi": "3.0.0",
+                "info": {"title": "API", "version": "1.0.0"},
+                "paths": {
+                    f"/items/{i}": {
+                        "get": {
+                            "parameters": [
+                                {"name": "q", "in": "query", "schema": {"type": param_type}}
+                            ],
+                            "responses": {"200": {}, extra_status: {}},
+                        }
+                    }
+                    for i in range(PARALLEL_MIN_PATHS + 50)
+                },
+            }
+
+        old_spec = build_spec("string", "404")
+        new_spec = build_spec("integer", "500")
+
+        serial = Differ().diff(old_spec, new_spec)
+        parallel = Differ().diff(old_spec, new_spec, parallel=True)
+
+        assert len(serial) > 0
+        assert parallel == serial
+
+
+OLD_SPEC_TEXT = json.dumps({
+    "openapi": "3.0.0",
+    "info": {"title": "API", "version": "1.0.0"},
+    "paths": {
+        "/users": {"get": {"responses": {"200": {"description": "OK"}}}},
+        "/posts": {"get": {"responses": {"200": {"description": "OK"}}}},
+    },
+})
+
+NEW_SPEC_TEXT = json.dumps({
+    "openapi": "3.0.0",
+    "info": {"title": "API", "version": "1.0.0"},
+    "paths": {
+        "/users": {"get": {"responses": {"200": {"description": "OK"}}}},
+    },
+})
+
+
+class TestCompareRoutes:
+    """Tests for the comparison endpoints."""
+
+    client = TestClient(app)
+    form = {"old_spec": OLD_SPEC_TEXT, "new_spec": NEW_SPEC_TEXT}
+
+    def test_compare_sets_etag(self):
+        """Test that comparison results carry a quoted ETag."""
+        response = self.client.post("/api/compare", data=self.form)
+
+        assert response.status_code == 200
+        assert response.json()["summary"]["breaking"] == 1
+        etag = response.headers["etag"]
+        assert etag.startswith('"') and etag.endswith('"')
+
+    @pytest.mark.parametrize("header", ["{etag}", "W/{etag}", '"other", {etag}', "*"])
+    def test_compare_matching_etag_returns_304(self, header):
+        """Test that a matching If-None-Match skips the comparison."""
+        etag = self.client.post("/api/compare", data=self.form).headers["etag"]
+
+        response = self.client.post(
+            "/api/compare", data=self.form, headers={"If-None-Match": header.format(etag=etag)}
+        )
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+    def test_compare_etag_changes_with_app_version(self, monkeypatch):
+        """Test that ETags issued by an earlier release no longer match."""
+        etag = self.client.post("/api/compare", data=self.form).headers["etag"]
+        monkeypatch.setattr(compare_routes, "APP_VERSION", "next")
+
+        response = self.client.post(
+            "/api/compare", data=self.form, headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_compare_mismatched_etag_returns_result(self):
+        """Test that a stale If-None-Match gets a full result."""
+        response = self.client.post(
+            "/api/compare", data=self.form, headers={"If-None-Match": '"stale"'}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["summary"]["breaking"] == 1
+
+    def test_compare_json_matches_form_compare(self):
+        """Test that the JSON endpoint returns the same result as the form endpoint."""
+        response = self.client.post("/api/compare-json", json=self.form)
+
+        assert response.status_code == 200
+        assert response.json() == self.client.post("/api/compare", data=self.form).json()
+
+    def test_compare_json_malformed_body_returns_400(self):
+        """Test that a body that is not JSON is rejected."""
+        response = self.client.post(
+            "/api/compare-json", content=b"{not json", headers={"Content-Type": "application/json"}
+        )
+
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize("payload", [
+        [OLD_SPEC_TEXT, NEW_SPEC_TEXT],
+        {"old_spec": OLD_SPEC_TEXT},
+        {"old_spec": OLD_SPEC_TEXT, "new_spec": {"openapi": "3.0.0"}},
+        {"old_spec": OLD_SPEC_TEXT, "new_spec": ""},
+    ])
+    def test_compare_json_invalid_payload_returns_400(self, payload):
+        """Test that non-object bodies and missing or non-string specs are rejected."""
+        response = self.client.post("/api/compare-json", json=payload)
+
+        assert response.status_code == 400
 
 
 if __name__ == "__main__":